@@ -0,0 +1,210 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Compiled counterpart of the wire (un)marshalling helpers in auth.py
+# Build in place with: cythonize -i _auth.pyx
+# auth.py falls back to its pure-Python helpers when this module is missing
+
+import struct
+
+from libc.stdint cimport int8_t, int16_t, int32_t, uint32_t
+from libc.string cimport memcpy, memset
+
+
+# Fixed-size wire frames, laid out exactly as they travel
+# Integers are stored as big-endian byte arrays, see _putInt*/_getInt*
+cdef packed struct ItrFrame:
+    unsigned char type[2]
+    char id[12]
+    unsigned char nonce[4]
+
+
+# Used by individual token responses and validations
+cdef packed struct TokenFrame:
+    unsigned char type[2]
+    char id[12]
+    unsigned char nonce[4]
+    char token[64]
+
+
+cdef packed struct TokenStatusFrame:
+    unsigned char type[2]
+    char id[12]
+    unsigned char nonce[4]
+    char token[64]
+    int8_t status
+
+
+cdef packed struct SasFrame:
+    char id[12]
+    unsigned char nonce[4]
+    char token[64]
+
+
+cdef inline void _putInt16(unsigned char* p, int16_t v) noexcept:
+    p[0] = (v >> 8) & 0xFF
+    p[1] = v & 0xFF
+
+
+cdef inline void _putInt32(unsigned char* p, int32_t v) noexcept:
+    p[0] = (v >> 24) & 0xFF
+    p[1] = (v >> 16) & 0xFF
+    p[2] = (v >> 8) & 0xFF
+    p[3] = v & 0xFF
+
+
+cdef inline int16_t _getInt16(const unsigned char* p) noexcept:
+    return <int16_t>((p[0] << 8) | p[1])
+
+
+cdef inline int32_t _getInt32(const unsigned char* p) noexcept:
+    return <int32_t>(
+        (<uint32_t>p[0] << 24) | (<uint32_t>p[1] << 16) | (<uint32_t>p[2] << 8) | p[3]
+    )
+
+
+# Range checks raise struct.error, like the pure-Python path does
+cdef inline int16_t _asInt16(object v) except? -1:
+    if not isinstance(v, int):
+        raise struct.error("required argument is not an integer")
+
+    if not -32768 <= v <= 32767:
+        raise struct.error("'h' format requires -32768 <= number <= 32767")
+
+    return v
+
+
+cdef inline int32_t _asInt32(object v) except? -1:
+    if not isinstance(v, int):
+        raise struct.error("required argument is not an integer")
+
+    if not -2147483648 <= v <= 2147483647:
+        raise struct.error("'i' format requires -2147483648 <= number <= 2147483647")
+
+    return v
+
+
+cdef inline bytes _asBytes(object v):
+    # struct's "Ns" takes bytes or bytearray, anything else is a struct.error
+    if isinstance(v, bytes):
+        return <bytes>v
+
+    if isinstance(v, bytearray):
+        return bytes(v)
+
+    raise struct.error("argument for 's' must be a bytes object")
+
+
+cdef inline void _putField(char* p, bytes value, Py_ssize_t size):
+    # Same as struct's "Ns": truncate long values, zero-pad short ones
+    cdef Py_ssize_t n = min(len(value), size)
+
+    memcpy(p, <const char*>value, n)
+    memset(p + n, 0, size - n)
+
+
+cdef inline str _decodeId(const char* p):
+    # Drop the space padding before decoding, like bytes.rstrip(b" ")
+    cdef Py_ssize_t n = 12
+
+    while n > 0 and p[n - 1] == c" ":
+        n -= 1
+
+    return p[:n].decode("ascii")
+
+
+cdef inline void _checkSize(Py_ssize_t have, Py_ssize_t need) except *:
+    if have < need:
+        raise struct.error(f"buffer of at least {need} bytes required, got {have}")
+
+
+cpdef bytes _packItr(object type, object id, object nonce):
+    cdef ItrFrame frame
+
+    _putInt16(frame.type, _asInt16(type))
+    _putField(frame.id, _asBytes(id), 12)
+    _putInt32(frame.nonce, _asInt32(nonce))
+
+    return (<char*>&frame)[:sizeof(ItrFrame)]
+
+
+cpdef tuple _unpackItrResponse(const unsigned char[::1] buf):
+    _checkSize(buf.shape[0], sizeof(TokenFrame))
+
+    cdef const TokenFrame* frame = <const TokenFrame*>&buf[0]
+
+    return (
+        _getInt16(frame.type),
+        _decodeId(frame.id),
+        _getInt32(frame.nonce),
+        frame.token[:64].decode("ascii"),
+    )
+
+
+cpdef bytes _packItv(object type, object id, object nonce, object token):
+    cdef TokenFrame frame
+
+    _putInt16(frame.type, _asInt16(type))
+    _putField(frame.id, _asBytes(id), 12)
+    _putInt32(frame.nonce, _asInt32(nonce))
+    _putField(frame.token, _asBytes(token), 64)
+
+    return (<char*>&frame)[:sizeof(TokenFrame)]
+
+
+cpdef tuple _unpackItvStatus(const unsigned char[::1] buf):
+    _checkSize(buf.shape[0], sizeof(TokenStatusFrame))
+
+    cdef const TokenStatusFrame* frame = <const TokenStatusFrame*>&buf[0]
+
+    return (
+        _getInt16(frame.type),
+        _decodeId(frame.id),
+        _getInt32(frame.nonce),
+        frame.token[:64].decode("ascii"),
+        frame.status,
+    )
+
+
+cpdef void _packSasChunk(
+    unsigned char[::1] buf, object ids, object nonces, object tokens
+) except *:
+    # SASes start right after the 4 byte group header, one frame every 80 bytes
+    # Any iterables are accepted and walked together, like zip in auth.py
+    cdef Py_ssize_t size = buf.shape[0]
+    cdef Py_ssize_t offset = 4
+    cdef SasFrame* frame
+
+    for id, nonce, token in zip(ids, nonces, tokens):
+        _checkSize(size, offset + sizeof(SasFrame))
+
+        frame = <SasFrame*>&buf[offset]
+
+        _putField(frame.id, _asBytes(id), 12)
+        _putInt32(frame.nonce, _asInt32(nonce))
+        _putField(frame.token, _asBytes(token), 64)
+
+        offset += sizeof(SasFrame)
+
+
+cpdef tuple _unpackSasChunk(const unsigned char[::1] chunk):
+    cdef Py_ssize_t n = chunk.shape[0] // sizeof(SasFrame)
+    cdef Py_ssize_t i
+    cdef const SasFrame* frames
+    cdef list ids = []
+    cdef list nonces = []
+    cdef list tokens = []
+
+    if chunk.shape[0] % sizeof(SasFrame):
+        raise struct.error("iterative unpacking requires a buffer of a multiple of 80 bytes")
+
+    if n == 0:
+        return ids, nonces, tokens
+
+    frames = <const SasFrame*>&chunk[0]
+
+    # Extract and parse each SAS (one SAS every 80 bytes)
+    for i in range(n):
+        ids.append(_decodeId(frames[i].id))
+        nonces.append(_getInt32(frames[i].nonce))
+        tokens.append(frames[i].token[:64].decode("ascii"))
+
+    return ids, nonces, tokens
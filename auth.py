@@ -1,16 +1,46 @@
 import socket
 import struct
-import argparse
+import sys
+import functools
+import threading
+
+from collections.abc import Sequence
+
+# Precompiled wire formats (big-endian, no alignment)
+_ITR_REQ = struct.Struct("!h12si")
+_ITR_RESP = struct.Struct("!h12si64s")
+_ITV_REQ = struct.Struct("!h12si64s")
+_ITV_RESP = struct.Struct("!h12si64sb")
+_SAS = struct.Struct("!12si64s")
+_GROUP_HDR = struct.Struct("!hh")
+_TOKEN = struct.Struct("!64s")
+
+
+@functools.lru_cache
+def _groupStruct(n: int, tail: str = "") -> struct.Struct:
+    # Group messages carry n SASes (80 bytes each), so their format depends on n
+    return struct.Struct(f"!hh{80*n}s{tail}")
 
 
 class IndividualTokenRequest:
+    __slots__ = ("type", "_id", "nonce", "_idBytes")
+
     def __init__(self, id: str, nonce: int):
         self.type: int = 1
-        self.id: str = id
+        self._id: str = id
         self.nonce: int = nonce
 
+        # Wire representation, encoded once; id is read-only so it cannot go stale
+        self._idBytes: bytes = id.encode("ascii").ljust(12, b" ")
+
+    @property
+    def id(self) -> str:
+        return self._id
+
 
 class IndividualTokenResponse:
+    __slots__ = ("type", "id", "nonce", "token")
+
     def __init__(self, type: int, id: str, nonce: int, token: str):
         self.type: int = type
         self.id: str = id
@@ -22,14 +52,31 @@ class IndividualTokenResponse:
 
 
 class IndividualTokenValidation:
+    __slots__ = ("type", "_id", "nonce", "_token", "_idBytes", "_tokenBytes")
+
     def __init__(self, id: str, nonce: int, token: str):
         self.type: int = 3
-        self.id: str = id
+        self._id: str = id
         self.nonce: int = nonce
-        self.token: str = token
+        self._token: str = token
+
+        # Wire representation, encoded once; id and token are read-only so it
+        # cannot go stale
+        self._idBytes: bytes = id.encode("ascii").ljust(12, b" ")
+        self._tokenBytes: bytes = token.encode("ascii")
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def token(self) -> str:
+        return self._token
 
 
 class IndividualTokenStatus:
+    __slots__ = ("type", "id", "nonce", "token", "status")
+
     def __init__(self, type: int, id: str, nonce: int, token: str, status: int):
         self.type: int = type
         self.id: str = id
@@ -38,128 +85,234 @@ class IndividualTokenStatus:
         self.status: int = status
 
 
+# Group messages keep ids, nonces and tokens as tuples, whatever sequences they
+# were built from. In requests/validations they are also read-only, since the wire
+# bytes are encoded from them once, on construction
 class GroupTokenRequest:
-    def __init__(self, n: int, group: list[tuple[str, int, str]]):
+    __slots__ = (
+        "type",
+        "n",
+        "_ids",
+        "_nonces",
+        "_tokens",
+        "_idsBytes",
+        "_tokensBytes",
+    )
+
+    def __init__(
+        self, n: int, ids: Sequence[str], nonces: Sequence[int], tokens: Sequence[str]
+    ):
         self.type: int = 5
         self.n: int = n
-        self.group: list[tuple[str, int, str]] = group
+        self._ids: tuple[str, ...] = tuple(ids)
+        self._nonces: tuple[int, ...] = tuple(nonces)
+        self._tokens: tuple[str, ...] = tuple(tokens)
+
+        # Wire representation, encoded once
+        self._idsBytes: list[bytes] = [i.encode("ascii").ljust(12, b" ") for i in ids]
+        self._tokensBytes: list[bytes] = [t.encode("ascii") for t in tokens]
+
+    @property
+    def ids(self) -> tuple[str, ...]:
+        return self._ids
+
+    @property
+    def nonces(self) -> tuple[int, ...]:
+        return self._nonces
+
+    @property
+    def tokens(self) -> tuple[str, ...]:
+        return self._tokens
 
 
 class GroupTokenResponse:
+    __slots__ = ("type", "n", "ids", "nonces", "tokens", "token")
+
     def __init__(
-        self, type: int, n: int, group: list[tuple[str, int, str]], token: str
+        self,
+        type: int,
+        n: int,
+        ids: Sequence[str],
+        nonces: Sequence[int],
+        tokens: Sequence[str],
+        token: str,
     ):
         self.type: int = type
         self.n: int = n
-        self.group: list[tuple[str, int, str]] = group
+        self.ids: tuple[str, ...] = tuple(ids)
+        self.nonces: tuple[int, ...] = tuple(nonces)
+        self.tokens: tuple[str, ...] = tuple(tokens)
         self.token: str = token
 
     def getStringGAS(self) -> str:
-        return f"{'+'.join([f'{sas[0]}:{sas[1]}:{sas[2]}' for sas in self.group])}+{self.token}"
+        parts: list[str] = [
+            f"{i}:{n}:{t}" for i, n, t in zip(self.ids, self.nonces, self.tokens)
+        ]
+        parts.append(self.token)
+
+        return "+".join(parts)
 
 
 class GroupTokenValidation:
-    def __init__(self, n: int, group: list[tuple[str, int, str]], token: str):
+    __slots__ = (
+        "type",
+        "n",
+        "_ids",
+        "_nonces",
+        "_tokens",
+        "_token",
+        "_idsBytes",
+        "_tokensBytes",
+        "_tokenBytes",
+    )
+
+    def __init__(
+        self,
+        n: int,
+        ids: Sequence[str],
+        nonces: Sequence[int],
+        tokens: Sequence[str],
+        token: str,
+    ):
         self.type: int = 7
         self.n: int = n
-        self.group: list[tuple[str, int, str]] = group
-        self.token: str = token
+        self._ids: tuple[str, ...] = tuple(ids)
+        self._nonces: tuple[int, ...] = tuple(nonces)
+        self._tokens: tuple[str, ...] = tuple(tokens)
+        self._token: str = token
+
+        # Wire representation, encoded once
+        self._idsBytes: list[bytes] = [i.encode("ascii").ljust(12, b" ") for i in ids]
+        self._tokensBytes: list[bytes] = [t.encode("ascii") for t in tokens]
+        self._tokenBytes: bytes = token.encode("ascii")
+
+    @property
+    def ids(self) -> tuple[str, ...]:
+        return self._ids
+
+    @property
+    def nonces(self) -> tuple[int, ...]:
+        return self._nonces
+
+    @property
+    def tokens(self) -> tuple[str, ...]:
+        return self._tokens
+
+    @property
+    def token(self) -> str:
+        return self._token
 
 
 class GroupTokenStatus:
+    __slots__ = ("type", "n", "ids", "nonces", "tokens", "token", "status")
+
     def __init__(
         self,
         type: int,
         n: int,
-        group: list[tuple[str, int, str]],
+        ids: Sequence[str],
+        nonces: Sequence[int],
+        tokens: Sequence[str],
         token: str,
         status: int,
     ):
         self.type: int = type
         self.n: int = n
-        self.group: list[tuple[str, int, str]] = group
+        self.ids: tuple[str, ...] = tuple(ids)
+        self.nonces: tuple[int, ...] = tuple(nonces)
+        self.tokens: tuple[str, ...] = tuple(tokens)
         self.token: str = token
         self.status: int = status
 
 
-def initParser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="Basic UDP Authentication Token Generator used in the Computer Networks course at UFMG."
-    )
+# Expected number of options and usage for each command
+# gtr takes N followed by a variable number of SASes, so it has no fixed count
+_COMMAND_USAGE: dict[str, tuple[int | None, str]] = {
+    "itr": (2, "itr <id> <nonce>"),
+    "itv": (1, "itv <SAS>"),
+    "gtr": (None, "gtr <N> <SAS-1> <SAS-2> ... <SAS-N>"),
+    "gtv": (1, "gtv <GAS>"),
+}
 
-    parser.add_argument(
-        "host",
-        metavar="host",
-        type=str,
-        help="Authentication server host, as an IPv4/IPv6 address or as a hostname",
-    )
 
-    parser.add_argument(
-        "port",
-        metavar="port",
-        type=int,
-        help="Authentication server port",
-    )
+def parseArgv(argv: list[str]) -> tuple[str, int, str, list[str]]:
+    # Usage: auth.py <host> <port> <command> <options...>
+    #   host    -> Authentication server host, as an IPv4/IPv6 address or as a hostname
+    #   port    -> Authentication server port
+    #   command -> Command to be executed. Available options: itr, itv, gtr, gtv
+    #   options -> Options for the selected command
+    if len(argv) < 5:
+        raise Exception("Expected usage: auth.py <host> <port> <command> <options...>")
 
-    parser.add_argument(
-        "command",
-        metavar="command",
-        type=str,
-        choices=["itr", "itv", "gtr", "gtv"],
-        help="Command to be executed. Available options: itr, itv, gtr, gtv",
-    )
+    host, port, command, *options = argv[1:]
 
-    parser.add_argument(
-        "options",
-        metavar="options",
-        type=str,
-        nargs="+",
-        help="Options for the selected command",
-    )
+    if not port.isdigit():
+        raise Exception(f"Invalid port: {port}")
 
-    return parser
+    if command not in _COMMAND_USAGE:
+        raise Exception(
+            f"Invalid command. Available options: {', '.join(_COMMAND_USAGE)}"
+        )
 
+    return host, int(port), command, options
 
-def validateArgs(args: argparse.Namespace) -> None:
-    match args.command:
-        case "itr":
-            if len(args.options) != 2:
-                raise Exception("Expected usage: itr <id> <nonce>")
-        case "itv":
-            if len(args.options) != 1:
-                raise Exception("Expected usage: itv <SAS>")
-        case "gtr":
-            if len(args.options) == 1:
-                raise Exception("Expected usage: gtr <N> <SAS-1> <SAS-2> ... <SAS-N>")
-        case "gtv":
-            if len(args.options) != 1:
-                raise Exception("Expected usage: gtv <GAS>")
+
+def validateArgs(command: str, options: list[str]) -> None:
+    expected, usage = _COMMAND_USAGE[command]
+
+    if expected is None:
+        if len(options) == 1:
+            raise Exception(f"Expected usage: {usage}")
+    elif len(options) != expected:
+        raise Exception(f"Expected usage: {usage}")
+
+
+# Auth server error messages, indexed by error code - 1
+_SERVER_ERROR_MSGS: tuple[str, ...] = (
+    "INVALID_MESSAGE_CODE",
+    "INCORRECT_MESSAGE_LENGTH",
+    "INVALID_PARAMETER",
+    "INVALID_SINGLE_TOKEN",
+    "ASCII_DECODE_ERROR",
+)
 
 
 def getServerErrorMsg(code: int) -> str:
-    authServerErrorMsg: list[str] = [
-        "INVALID_MESSAGE_CODE",
-        "INCORRECT_MESSAGE_LENGTH",
-        "INVALID_PARAMETER",
-        "INVALID_SINGLE_TOKEN",
-        "ASCII_DECODE_ERROR",
-    ]
-
-    if code > len(authServerErrorMsg) or code < 1:
+    if code > len(_SERVER_ERROR_MSGS) or code < 1:
         return "UNKNOWN_ERROR_CODE"
 
-    return authServerErrorMsg[code - 1]
+    return _SERVER_ERROR_MSGS[code - 1]
+
+
+def getServerErrorCode(res: bytes | memoryview) -> int | None:
+    # Server errors are type 256 (0x0100 big-endian) followed by the code
+    # Returns None when res is not an error message
+    if len(res) >= 4 and res[0] == 1 and res[1] == 0:
+        return res[2] << 8 | res[3]
+
+    return None
 
 
 # Adapted from: https://docs.python.org/3/library/socket.html#creating-sockets
-def initConnection(host: str, port: int) -> socket.socket:
+def initConnection(host: str, port: int, timeoutSec: float = 6.0) -> socket.socket:
     sock: socket.socket = None
 
     # This will resolve any hostname, and check for IPv4 and IPv6 addresses
     # The first socket to get a successful connection is returned
     # Note: using SOCK_DGRAM for UDP
 
-    for res in socket.getaddrinfo(host, port, socket.AF_UNSPEC, socket.SOCK_DGRAM):
+    # IPv4/IPv6 literals are parsed directly, skipping name resolution
+    try:
+        addrs: list[tuple] = socket.getaddrinfo(
+            host, port, socket.AF_UNSPEC, socket.SOCK_DGRAM, 0, socket.AI_NUMERICHOST
+        )
+    except socket.gaierror as msg:
+        if msg.errno != socket.EAI_NONAME:
+            raise
+
+        addrs = socket.getaddrinfo(host, port, socket.AF_UNSPEC, socket.SOCK_DGRAM)
+
+    for res in addrs:
         af, socktype, proto, canonname, sa = res
 
         try:
@@ -183,24 +336,40 @@ def initConnection(host: str, port: int) -> socket.socket:
         print("ERROR: Could not open a valid socket")
         exit(1)
 
+    # Set once here instead of on every send
+    sock.settimeout(timeoutSec)
+
     return sock
 
 
+# Receive buffers are reused across calls, one per thread
+_recvBuffers: threading.local = threading.local()
+
+
+def _recvBuffer(size: int) -> bytearray:
+    buf: bytearray = getattr(_recvBuffers, "buf", None)
+
+    if buf is None or len(buf) < size:
+        buf = _recvBuffers.buf = bytearray(size)
+
+    return buf
+
+
+# Note: the returned view points into this thread's receive buffer,
+# so it is only valid until the next call to sendPayload
 def sendPayload(
     sock: socket.socket,
-    payload: bytes,
+    payload: bytes | bytearray,
     bufSize: int = 4096,
-    timeoutSec: float = 6.0,
     attempts: int = 5,
-) -> bytes:
-    res: bytes = bytes()
-
-    sock.settimeout(timeoutSec)
+) -> memoryview:
+    buf: bytearray = _recvBuffer(bufSize)
+    nbytes: int = 0
 
     while attempts:
         try:
             sock.send(payload)
-            res = sock.recv(bufSize)
+            nbytes = sock.recv_into(buf, bufSize)
             break
         except socket.timeout:
             attempts -= 1
@@ -208,74 +377,135 @@ def sendPayload(
             print(f"ERROR: Could not send and/or receive data. {msg}")
             exit(2)
 
-    if len(res) == 0:
+    if nbytes == 0:
         print("ERROR: No response from the server")
         exit(3)
 
+    res: memoryview = memoryview(buf)[:nbytes]
+
     # Check for server errors
-    if len(res) == 4:
-        type, code = struct.unpack("!hh", res)
+    code: int | None = getServerErrorCode(res)
 
-        if type == 256:
-            print(
-                f"ERROR: Auth server returned an error. [{code}] {getServerErrorMsg(code)}"
-            )
-            exit(4)
+    if code is not None:
+        print(
+            f"ERROR: Auth server returned an error. [{code}] {getServerErrorMsg(code)}"
+        )
+        exit(4)
 
     return res
 
 
+# Wire (un)marshalling helpers
+# h   -> 2 byte type integer
+# 12s -> 12 byte ID ASCII, padded with spaces (already encoded by the caller)
+# i   -> 4 byte nonce integer
+# 64s -> 64 byte token ASCII
+# b   -> 1 byte status
+# These have a compiled counterpart in _auth.pyx, keep both in sync
+
+
+def _packItr(type: int, id: bytes, nonce: int) -> bytes:
+    return _ITR_REQ.pack(type, id, nonce)
+
+
+def _unpackItrResponse(buf: memoryview) -> tuple[int, str, int, str]:
+    raw: tuple[int, bytes, int, bytes] = _ITR_RESP.unpack_from(buf)
+
+    return raw[0], raw[1].rstrip(b" ").decode("ascii"), raw[2], raw[3].decode("ascii")
+
+
+def _packItv(type: int, id: bytes, nonce: int, token: bytes) -> bytes:
+    return _ITV_REQ.pack(type, id, nonce, token)
+
+
+def _unpackItvStatus(buf: memoryview) -> tuple[int, str, int, str, int]:
+    raw: tuple[int, bytes, int, bytes, int] = _ITV_RESP.unpack_from(buf)
+
+    return (
+        raw[0],
+        raw[1].rstrip(b" ").decode("ascii"),
+        raw[2],
+        raw[3].decode("ascii"),
+        raw[4],
+    )
+
+
+def _packSasChunk(
+    buf: bytearray,
+    ids: Sequence[bytes],
+    nonces: Sequence[int],
+    tokens: Sequence[bytes],
+) -> None:
+    # SASes start right after the 4 byte group header, one every 80 bytes
+    pack = _SAS.pack_into
+    offset: int = 4
+
+    for id, nonce, token in zip(ids, nonces, tokens):
+        pack(buf, offset, id, nonce, token)
+        offset += 80
+
+
+def _unpackSasChunk(chunk: bytes) -> tuple[list[str], list[int], list[str]]:
+    ids: list[str] = list()
+    nonces: list[int] = list()
+    tokens: list[str] = list()
+
+    # Extract and parse each SAS (one SAS every 80 bytes)
+    for rawSas in _SAS.iter_unpack(chunk):
+        ids.append(rawSas[0].rstrip(b" ").decode("ascii"))
+        nonces.append(rawSas[1])
+        tokens.append(rawSas[2].decode("ascii"))
+
+    return ids, nonces, tokens
+
+
+# Prefer the compiled helpers when the extension has been built
+try:
+    from _auth import (
+        _packItr,
+        _unpackItrResponse,
+        _packItv,
+        _unpackItvStatus,
+        _packSasChunk,
+        _unpackSasChunk,
+    )
+except ImportError:
+    pass
+
+
+# Wire payload of an individual token request, for callers that do their own I/O
+def packIndividualTokenRequest(itr: IndividualTokenRequest) -> bytes:
+    return _packItr(itr.type, itr._idBytes, itr.nonce)
+
+
+# Parse an individual token response received by callers that do their own I/O
+# Raises struct.error/ValueError when res is not a valid response
+def parseIndividualTokenResponse(res: bytes | memoryview) -> IndividualTokenResponse:
+    return IndividualTokenResponse(*_unpackItrResponse(res))
+
+
 def sendIndividualTokenRequest(
     sock: socket.socket, itr: IndividualTokenRequest
 ) -> IndividualTokenResponse:
-    # Prepare data
-    # h   -> 2 byte type integer
-    # 12s -> 12 byte no-align ID ASCII
-    # i   -> 4 byte nonce integer
-    payload: bytes = struct.pack(
-        "!h12si",
-        itr.type,
-        bytes(itr.id.ljust(12), encoding="ascii"),
-        itr.nonce
-    )
+    payload: bytes = packIndividualTokenRequest(itr)
 
     # Send
-    res: bytes = sendPayload(sock, payload)
+    res: memoryview = sendPayload(sock, payload)
 
     # No errors, return parsed result
-    raw: tuple[int, bytes, int, bytes] = struct.unpack("!h12si64s", res)
-
-    return IndividualTokenResponse(
-        raw[0], raw[1].decode("ascii").strip(), raw[2], raw[3].decode("ascii")
-    )
+    return parseIndividualTokenResponse(res)
 
 
 def sendIndividualTokenValidation(
     sock: socket.socket, itv: IndividualTokenValidation
 ) -> IndividualTokenStatus:
-    # Prepare data
-    # h   -> 2 byte type integer
-    # 12s -> 12 byte ID ASCII
-    # i   -> 4 byte nonce integer
-    # 64s -> 12 byte token ASCII
-    # b   -> 1 byte status
-    payload: bytes = struct.pack(
-        "!h12si64s",
-        itv.type,
-        bytes(itv.id.ljust(12), encoding="ascii"),
-        itv.nonce,
-        bytes(itv.token, encoding="ascii"),
-    )
+    payload: bytes = _packItv(itv.type, itv._idBytes, itv.nonce, itv._tokenBytes)
 
     # Send
-    res: bytes = sendPayload(sock, payload)
+    res: memoryview = sendPayload(sock, payload)
 
     # No errors, return parsed result
-    raw: tuple[int, bytes, int, bytes, int] = struct.unpack("!h12si64sb", res)
-
-    return IndividualTokenStatus(
-        raw[0], raw[1].decode("ascii").strip(), raw[2], raw[3].decode("ascii"), raw[4]
-    )
+    return IndividualTokenStatus(*_unpackItvStatus(res))
 
 
 def sendGroupTokenRequest(
@@ -286,36 +516,27 @@ def sendGroupTokenRequest(
     # h   -> 2 byte n integer
     # 80*ns -> 80*n byte sas
 
-    # Build SASes chunk
-    sasChunk: bytes = bytes()
+    if len(gtr.ids) != gtr.n:
+        raise Exception(f"Expected {gtr.n} SASes, got {len(gtr.ids)}")
 
-    for sas in gtr.group:
-        sasChunk += struct.pack(
-            "!12si64s",
-            bytes(sas[0].ljust(12), encoding="ascii"),
-            sas[1],
-            bytes(sas[2], encoding="ascii"),
-        )
+    # Pack header and SASes straight into a single preallocated buffer
+    payload: bytearray = bytearray(4 + 80 * gtr.n)
+
+    _GROUP_HDR.pack_into(payload, 0, gtr.type, gtr.n)
 
-    payload: bytes = struct.pack(f"!hh{80*gtr.n}s", gtr.type, gtr.n, sasChunk)
+    _packSasChunk(payload, gtr._idsBytes, gtr.nonces, gtr._tokensBytes)
 
     # Send
-    res: bytes = sendPayload(sock, payload)
+    res: memoryview = sendPayload(sock, payload)
 
     # No errors, return parsed result
-    raw: tuple[int, int, bytes, bytes] = struct.unpack(f"!hh{80*gtr.n}s64s", res)
-
-    group: list[tuple[str, int, str]] = list()
-
-    # Extract and parse each SAS individually (one SAS every 80 bytes)
-    for sas in [raw[2][80 * i : 80 * (i + 1)] for i in range(gtr.n)]:
-        rawSas: tuple[bytes, int, bytes] = struct.unpack("!12si64s", sas)
+    raw: tuple[int, int, bytes, bytes] = _groupStruct(gtr.n, "64s").unpack_from(res)
 
-        group.append(
-            (rawSas[0].decode("ascii").strip(), rawSas[1], rawSas[2].decode("ascii"))
-        )
+    ids, nonces, tokens = _unpackSasChunk(raw[2])
 
-    return GroupTokenResponse(raw[0], raw[1], group, raw[3].decode("ascii"))
+    return GroupTokenResponse(
+        raw[0], raw[1], ids, nonces, tokens, raw[3].decode("ascii")
+    )
 
 
 def sendGroupTokenValidation(
@@ -327,63 +548,51 @@ def sendGroupTokenValidation(
     # 80*ns -> 80*n byte sas
     # b   -> 1 byte status
 
-    # Build SASes chunk
-    sasChunk: bytes = bytes()
+    if len(gtv.ids) != gtv.n:
+        raise Exception(f"Expected {gtv.n} SASes, got {len(gtv.ids)}")
 
-    for sas in gtv.group:
-        sasChunk += struct.pack(
-            "!12si64s",
-            bytes(sas[0].ljust(12), encoding="ascii"),
-            sas[1],
-            bytes(sas[2], encoding="ascii"),
-        )
+    # Pack header, SASes and token straight into a single preallocated buffer
+    payload: bytearray = bytearray(4 + 80 * gtv.n + 64)
 
-    payload: bytes = struct.pack(
-        f"!hh{80*gtv.n}s64s",
-        gtv.type,
-        gtv.n,
-        sasChunk,
-        bytes(gtv.token, encoding="ascii"),
-    )
+    _GROUP_HDR.pack_into(payload, 0, gtv.type, gtv.n)
+
+    _packSasChunk(payload, gtv._idsBytes, gtv.nonces, gtv._tokensBytes)
+
+    _TOKEN.pack_into(payload, 4 + 80 * gtv.n, gtv._tokenBytes)
 
     # Send
-    res: bytes = sendPayload(sock, payload)
+    res: memoryview = sendPayload(sock, payload)
 
     # No errors, return parsed result
-    raw: tuple[int, int, bytes, bytes, int] = struct.unpack(f"!hh{80*gtv.n}s64sb", res)
+    raw: tuple[int, int, bytes, bytes, int] = _groupStruct(
+        gtv.n, "64sb"
+    ).unpack_from(res)
 
-    group: list[tuple[str, int, str]] = list()
+    ids, nonces, tokens = _unpackSasChunk(raw[2])
 
-    # Extract and parse each SAS individually (one SAS every 80 bytes)
-    for sas in [raw[2][80 * i : 80 * (i + 1)] for i in range(gtv.n)]:
-        rawSas: tuple[bytes, int, bytes] = struct.unpack("!12si64s", sas)
-
-        group.append(
-            (rawSas[0].decode("ascii").strip(), rawSas[1], rawSas[2].decode("ascii"))
-        )
-
-    return GroupTokenStatus(raw[0], raw[1], group, raw[3].decode("ascii"), raw[4])
+    return GroupTokenStatus(
+        raw[0], raw[1], ids, nonces, tokens, raw[3].decode("ascii"), raw[4]
+    )
 
 
 if __name__ == "__main__":
     # Get args
-    parser = initParser()
-    args = parser.parse_args()
-    validateArgs(args)
+    host, port, command, options = parseArgv(sys.argv)
+    validateArgs(command, options)
 
     # Connect
-    sock: socket.socket = initConnection(args.host, args.port)
+    sock: socket.socket = initConnection(host, port)
 
     # Perform command
-    match args.command:
+    match command:
         case "itr":
             itres = sendIndividualTokenRequest(
-                sock, IndividualTokenRequest(args.options[0], int(args.options[1]))
+                sock, IndividualTokenRequest(options[0], int(options[1]))
             )
 
             print(itres.getStringSAS())
         case "itv":
-            data: list[str] = args.options[0].split(":")
+            data: list[str] = options[0].split(":")
 
             its = sendIndividualTokenValidation(
                 sock, IndividualTokenValidation(data[0], int(data[1]), data[2])
@@ -391,28 +600,38 @@ if __name__ == "__main__":
 
             print(its.status)
         case "gtr":
-            n: int = int(args.options[0])
+            n: int = int(options[0])
 
-            group: list[tuple[str, int, str]] = list()
+            ids: list[str] = list()
+            nonces: list[int] = list()
+            tokens: list[str] = list()
 
-            for sas in args.options[1:]:
+            for sas in options[1:]:
                 data: list[str] = sas.split(":")
-                group.append((data[0], int(data[1]), data[2]))
+                ids.append(data[0])
+                nonces.append(int(data[1]))
+                tokens.append(data[2])
 
-            gtres = sendGroupTokenRequest(sock, GroupTokenRequest(n, group))
+            gtres = sendGroupTokenRequest(
+                sock, GroupTokenRequest(n, ids, nonces, tokens)
+            )
 
             print(gtres.getStringGAS())
         case "gtv":
-            input: list[str] = args.options[0].split("+")
+            input: list[str] = options[0].split("+")
 
-            group: list[tuple[str, int, str]] = list()
+            ids: list[str] = list()
+            nonces: list[int] = list()
+            tokens: list[str] = list()
 
             for sas in input[:-1]:
                 data: list[str] = sas.split(":")
-                group.append((data[0], int(data[1]), data[2]))
+                ids.append(data[0])
+                nonces.append(int(data[1]))
+                tokens.append(data[2])
 
             gts = sendGroupTokenValidation(
-                sock, GroupTokenValidation(len(group), group, input[-1])
+                sock, GroupTokenValidation(len(ids), ids, nonces, tokens, input[-1])
             )
 
             print(gts.status)
@@ -0,0 +1,107 @@
+import struct
+import asyncio
+
+from auth import (
+    IndividualTokenRequest,
+    IndividualTokenResponse,
+    getServerErrorCode,
+    getServerErrorMsg,
+    packIndividualTokenRequest,
+    parseIndividualTokenResponse,
+)
+
+
+# Optional fast path for minting many individual tokens at once (e.g. before a gtr):
+# every request is sent right away over a single socket and replies are matched
+# back by their (id, nonce) bytes, so N tokens cost about one round trip, not N
+class _IndividualTokenProtocol(asyncio.DatagramProtocol):
+    def __init__(self, pending: dict[bytes, asyncio.Future]):
+        self.pending: dict[bytes, asyncio.Future] = pending
+
+    def _fail(self, exc: Exception) -> None:
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        # Server errors carry no id/nonce, so they fail every pending request
+        code: int | None = getServerErrorCode(data)
+
+        if code is not None:
+            self._fail(
+                Exception(
+                    f"Auth server returned an error. [{code}] {getServerErrorMsg(code)}"
+                )
+            )
+            return
+
+        # Bytes 2-18 hold the echoed id and nonce, same as in the request
+        future: asyncio.Future = self.pending.get(data[2:18])
+
+        if future is None or future.done():
+            return
+
+        try:
+            future.set_result(parseIndividualTokenResponse(data))
+        except (struct.error, ValueError) as msg:
+            future.set_exception(msg)
+
+    def error_received(self, exc: Exception) -> None:
+        self._fail(exc)
+
+
+async def _awaitWithRetransmit(
+    transport: asyncio.DatagramTransport,
+    payload: bytes,
+    future: asyncio.Future,
+    timeoutSec: float,
+    attempts: int,
+) -> IndividualTokenResponse:
+    while attempts:
+        transport.sendto(payload)
+
+        try:
+            # Shielded so a timeout does not cancel a future shared by duplicates
+            return await asyncio.wait_for(asyncio.shield(future), timeoutSec)
+        except asyncio.TimeoutError:
+            attempts -= 1
+
+    raise Exception("No response from the server")
+
+
+async def sendManyIndividualTokenRequests(
+    host: str,
+    port: int,
+    itrs: list[IndividualTokenRequest],
+    timeoutSec: float = 6.0,
+    attempts: int = 5,
+) -> list[IndividualTokenResponse]:
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+    payloads: list[bytes] = [packIndividualTokenRequest(itr) for itr in itrs]
+    pending: dict[bytes, asyncio.Future] = dict()
+
+    for payload in payloads:
+        if payload[2:18] not in pending:
+            pending[payload[2:18]] = loop.create_future()
+
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _IndividualTokenProtocol(pending), remote_addr=(host, port)
+    )
+
+    tasks: list[asyncio.Task] = [
+        asyncio.create_task(
+            _awaitWithRetransmit(
+                transport, payload, pending[payload[2:18]], timeoutSec, attempts
+            )
+        )
+        for payload in payloads
+    ]
+
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        transport.close()